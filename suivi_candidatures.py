@@ -12,7 +12,7 @@ Fonctionnalités (conformes au cahier des charges) :
 ✅ Rappels de date limite (paramétrable, par défaut 3 jours) + badge comptage
 ✅ Export CSV / Import CSV
 ✅ Sauvegarde auto à chaque opération (SQLite)
-✅ Modèle SQL Qt pour meilleures perfs (QSqlTableModel + QSortFilterProxyModel)
+✅ Modèle SQL Qt pour meilleures perfs (QSqlQueryModel + QSortFilterProxyModel)
 
 Exécution :
     pip install PySide6
@@ -26,13 +26,13 @@ import csv
 import os
 import sys
 import typing as t
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
 from PySide6.QtCore import (QAbstractTableModel, QDate, QItemSelectionModel,
-                            QLocale, QRegularExpression, QSortFilterProxyModel,
+                            QLocale, QSortFilterProxyModel,
                             Qt, QTimer, Signal, Slot)
 from PySide6.QtGui import QAction, QIcon
-from PySide6.QtSql import QSqlDatabase, QSqlQuery, QSqlTableModel
+from PySide6.QtSql import QSqlDatabase, QSqlQuery, QSqlQueryModel
 from PySide6.QtWidgets import (
     QApplication, QCheckBox, QComboBox, QDateEdit, QDialog, QDialogButtonBox,
     QFileDialog, QFormLayout, QGridLayout, QGroupBox, QHBoxLayout, QLabel,
@@ -72,6 +72,43 @@ CANAL_ENVOI = [
 
 DATE_FMT = "%Y-%m-%d"  # ISO pour SQLite et cohérence
 
+# Colonnes saisies par l'utilisateur (hors id / created_at)
+EDIT_FIELDS = [
+    "numero", "titre", "structure", "date_limite", "priorite",
+    "canal_envoi", "statut", "date_envoi", "notes",
+]
+# Toutes les colonnes de la table, dans l'ordre (export CSV, lecture d'une ligne)
+FIELDS = ["id"] + EDIT_FIELDS + ["created_at"]
+# Colonnes couvertes par la recherche texte (index plein texte FTS5)
+SEARCH_FIELDS = ["numero", "titre", "structure", "priorite", "canal_envoi", "statut", "notes"]
+FTS_TABLE = f"{TABLE_NAME}_fts"
+# Lignes par INSERT multi-VALUES (9 colonnes x 50 = 450 paramètres, < limite SQLite de 999)
+INSERT_BATCH = 50
+# Lignes CSV accumulées en mémoire avant insertion (borne la mémoire à l'import)
+IMPORT_CHUNK = 500
+
+# Feuilles de style des thèmes (le mode clair garde le style natif)
+LIGHT_QSS = ""
+DARK_QSS = """
+QMainWindow { background-color: #121212; color: #eee; }
+QWidget { background-color: #121212; color: #eee; }
+QLineEdit, QTextEdit, QComboBox, QDateEdit, QSpinBox {
+    background-color: #1e1e1e; color: #eee; border: 1px solid #444;
+}
+QTableView {
+    background-color: #1e1e1e;
+    alternate-background-color: #2a2a2a;
+    color: #eee;
+    gridline-color: #444;
+}
+QHeaderView::section {
+    background-color: #2a2a2a;
+    color: #eee;
+    padding: 4px;
+    border: 1px solid #444;
+}
+"""
+
 
 def ensure_database(path: str = DB_PATH) -> None:
     """Crée le fichier SQLite et la table si nécessaire."""
@@ -83,6 +120,17 @@ def ensure_database(path: str = DB_PATH) -> None:
         QMessageBox.critical(None, APP_NAME, f"Impossible d'ouvrir la base de données : {db.lastError().text()}")
         sys.exit(1)
 
+    # Réglages SQLite : journal WAL (persistant), fsync allégé, cache 20 Mo, mmap 256 Mo
+    q = QSqlQuery()
+    for pragma in (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA mmap_size=268435456",
+    ):
+        q.exec(pragma)
+
     if need_init:
         q = QSqlQuery()
         ok = q.exec(
@@ -106,6 +154,44 @@ def ensure_database(path: str = DB_PATH) -> None:
             QMessageBox.critical(None, APP_NAME, f"Erreur création table : {q.lastError().text()}")
             sys.exit(1)
 
+    # Index sur les colonnes de filtre (idempotent, aussi pour les bases existantes)
+    q = QSqlQuery()
+    for ddl in (
+        f"CREATE INDEX IF NOT EXISTS idx_cand_statut_dl ON {TABLE_NAME}(statut, date_limite)",
+        f"CREATE INDEX IF NOT EXISTS idx_cand_priorite ON {TABLE_NAME}(priorite)",
+    ):
+        if not q.exec(ddl):
+            QMessageBox.critical(None, APP_NAME, f"Erreur création index : {q.lastError().text()}")
+            sys.exit(1)
+
+    # Index plein texte (FTS5, contenu externe) synchronisé par triggers
+    q.exec(f"SELECT 1 FROM sqlite_master WHERE type='table' AND name='{FTS_TABLE}'")
+    need_fts_rebuild = not q.next()
+    cols = ", ".join(SEARCH_FIELDS)
+    new_cols = ", ".join(f"new.{c}" for c in SEARCH_FIELDS)
+    old_cols = ", ".join(f"old.{c}" for c in SEARCH_FIELDS)
+    for ddl in (
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+                {cols}, content='{TABLE_NAME}', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2')""",
+        f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TABLE_NAME} BEGIN
+                INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols});
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TABLE_NAME} BEGIN
+                INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON {TABLE_NAME} BEGIN
+                INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+                INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols});
+            END""",
+    ):
+        if not q.exec(ddl):
+            QMessageBox.critical(None, APP_NAME, f"Erreur création index plein texte : {q.lastError().text()}")
+            sys.exit(1)
+    if need_fts_rebuild:
+        # Base existante : indexer les lignes déjà présentes
+        q.exec(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
 
 class CandidatureDialog(QDialog):
     """Fenêtre d'ajout / édition d'une candidature."""
@@ -209,72 +295,141 @@ class CandidatureDialog(QDialog):
         }
 
 
+def fts_query(text: str) -> str:
+    """Requête FTS5 : chaque mot saisi est cherché comme préfixe (mots combinés en ET)."""
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in text.split())
+
+
+class CandidatureModel(QSqlQueryModel):
+    """Modèle des candidatures : SELECT explicite (filtre + paramètres liés), écritures préparées."""
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._filter = ""
+        self._params: dict = {}
+        # Valeurs éditées dans le tableau depuis le dernier SELECT : (ligne, colonne) -> valeur
+        self._overrides: dict[tuple[int, int], t.Any] = {}
+
+    def fieldIndex(self, name: str) -> int:
+        return self.record().indexOf(name)
+
+    def filter(self) -> str:
+        return self._filter
+
+    def setFilter(self, clause: str, params: dict | None = None):
+        params = params or {}
+        if clause == self._filter and params == self._params:
+            return
+        self._filter = clause
+        self._params = params
+        self.select()
+
+    def select(self) -> bool:
+        q = QSqlQuery()
+        sql = f"SELECT {', '.join(FIELDS)} FROM {TABLE_NAME}"
+        if self._filter:
+            sql += f" WHERE {self._filter}"
+        q.prepare(sql)
+        for k, v in self._params.items():
+            q.bindValue(k, v)
+        q.exec()
+        self._overrides.clear()
+        self.setQuery(q)
+        return not self.lastError().isValid()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.EditRole) and self._overrides:
+            key = (index.row(), index.column())
+            if key in self._overrides:
+                return self._overrides[key]
+        return super().data(index, role)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if self.record().fieldName(index.column()) in EDIT_FIELDS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        # Édition directe dans le tableau : UPDATE de la seule colonne modifiée
+        name = self.record().fieldName(index.column())
+        if role != Qt.EditRole or name not in EDIT_FIELDS:
+            return False
+        id_val = self.data(self.index(index.row(), self.fieldIndex("id")))
+        q = QSqlQuery()
+        q.prepare(f"UPDATE {TABLE_NAME} SET {name}=:value WHERE id=:id")
+        q.bindValue(":value", value if value != "" else None)
+        q.bindValue(":id", id_val)
+        if not q.exec():
+            return False
+        # Pas de rechargement (qui réinitialiserait vue, défilement et éditeur) :
+        # la valeur écrite est servie par data() jusqu'au prochain SELECT.
+        self._overrides[(index.row(), index.column())] = value if value != "" else None
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+
 class CandidatureFilterProxy(QSortFilterProxyModel):
-    """Proxy pour recherche texte + filtres statut/priorité + date limite max."""
+    """Proxy de tri ; recherche texte + filtres statut/priorité/date limite max appliqués en SQL."""
 
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
-        self.search_regex = QRegularExpression("")
+        self.search_text = ""
         self.filter_statut: str | None = None
         self.filter_priorite: str | None = None
         self.max_deadline: str | None = None  # YYYY-MM-DD
 
+        # Regroupe les changements de filtre rapprochés (frappe, flèches de date) en une seule ré-évaluation
+        self._invalidate_timer = QTimer(self)
+        self._invalidate_timer.setSingleShot(True)
+        self._invalidate_timer.setInterval(150)
+        self._invalidate_timer.timeout.connect(self._apply_filters)
+
     def set_search_text(self, text: str):
-        self.search_regex = QRegularExpression(text, QRegularExpression.CaseInsensitiveOption)
-        self.invalidateFilter()
+        self.search_text = text.strip()
+        self._invalidate_timer.start()
 
     def set_filter_statut(self, statut: str | None):
         self.filter_statut = statut if statut and statut != "(Tous)" else None
-        self.invalidateFilter()
+        self._invalidate_timer.start()
 
     def set_filter_priorite(self, priorite: str | None):
         self.filter_priorite = priorite if priorite and priorite != "(Toutes)" else None
-        self.invalidateFilter()
+        self._invalidate_timer.start()
 
     def set_max_deadline(self, date_str: str | None):
         self.max_deadline = date_str
-        self.invalidateFilter()
+        self._invalidate_timer.start()
 
-    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
-        model = self.sourceModel()
-        if model is None:
-            return True
+    def sql_filter(self) -> tuple[str, dict]:
+        """Clause WHERE (sans le mot-clé) et valeurs à lier, selon les filtres courants."""
+        clauses = []
+        params = {}
 
-        def data(col_name: str) -> str:
-            idx = model.index(source_row, model.fieldIndex(col_name), source_parent)
-            return (model.data(idx) or "").lower()
-
-        # Recherche texte (dans plusieurs colonnes)
-        if self.search_regex.pattern():
-            hay = " ".join([
-                data("numero"), data("titre"), data("structure"),
-                data("priorite"), data("canal_envoi"), data("statut"), data("notes")
-            ])
-            if not self.search_regex.match(hay).hasMatch():
-                return False
+        # Recherche texte (index plein texte sur plusieurs colonnes)
+        if self.search_text:
+            clauses.append(f"id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :search)")
+            params[":search"] = fts_query(self.search_text)
 
-        # Filtre statut
         if self.filter_statut is not None:
-            if data("statut") != self.filter_statut.lower():
-                return False
+            clauses.append("statut = :statut")
+            params[":statut"] = self.filter_statut
 
-        # Filtre priorité
         if self.filter_priorite is not None:
-            if data("priorite") != self.filter_priorite.lower():
-                return False
+            clauses.append("priorite = :priorite")
+            params[":priorite"] = self.filter_priorite
 
-        # Filtre date limite max
+        # Date limite max (les candidatures sans date limite restent visibles)
         if self.max_deadline:
-            dl_idx = model.index(source_row, model.fieldIndex("date_limite"), source_parent)
-            dl_val = model.data(dl_idx)
-            if dl_val:
-                try:
-                    if dl_val > self.max_deadline:
-                        return False
-                except Exception:
-                    pass
+            clauses.append("(date_limite IS NULL OR date_limite <= :maxd)")
+            params[":maxd"] = self.max_deadline
 
-        return True
+        return " AND ".join(clauses), params
+
+    def _apply_filters(self):
+        model = self.sourceModel()
+        if model is not None:
+            model.setFilter(*self.sql_filter())
 
 
 class MainWindow(QMainWindow):
@@ -289,14 +444,26 @@ class MainWindow(QMainWindow):
         self.remind_days = 3
 
         # Modèle SQL
-        self.model = QSqlTableModel(self)
-        self.model.setTable(TABLE_NAME)
-        self.model.setEditStrategy(QSqlTableModel.OnFieldChange)
+        self.model = CandidatureModel(self)
         self.model.select()
+        # Index de colonne par nom (fieldIndex fait une recherche linéaire)
+        self._col = {name: self.model.fieldIndex(name) for name in FIELDS}
+
+        # Requête de suppression préparée une fois, réutilisée à chaque suppression
+        self._delete_stmt = QSqlQuery()
+        self._delete_stmt.prepare(f"DELETE FROM {TABLE_NAME} WHERE id=:id")
+        # Idem pour le comptage des rappels
+        self._remind_stmt = QSqlQuery()
+        self._remind_stmt.prepare(
+            f"SELECT COUNT(*) FROM {TABLE_NAME} WHERE statut = 'À postuler' AND date_limite IS NOT NULL AND date_limite BETWEEN :d1 AND :d2"
+        )
 
         # Proxy pour recherches/tri
         self.proxy = CandidatureFilterProxy(self)
         self.proxy.setSourceModel(self.model)
+        # Colonnes de la vue par nom. Le proxy ne filtre ni ne réordonne les colonnes :
+        # l'index est celui de la source (mapFromSource exigerait une ligne, donc une table non vide).
+        self._proxy_col = {name: col for name, col in self._col.items() if col >= 0}
 
         # Table
         self.table = QTableView()
@@ -389,11 +556,13 @@ class MainWindow(QMainWindow):
         # Barre de statut
         self.status = QStatusBar(); self.setStatusBar(self.status)
 
-        # Timer de rappel
-        self.timer = QTimer(self)
-        self.timer.setInterval(60 * 1000)  # vérif toutes les 60s
-        self.timer.timeout.connect(self.update_reminders)
-        self.timer.start()
+        # Rappels recalculés quand les données ou le seuil changent (pas de scrutation périodique) :
+        # appel explicite après chaque écriture, dataChanged pour l'édition directe dans le tableau.
+        # modelReset n'est pas suivi : il est aussi émis à chaque changement de filtre.
+        self.model.dataChanged.connect(self.update_reminders)
+        self.remindThresholdDaysChanged.connect(self.update_reminders)
+        # ... et une fois par jour, au changement de date
+        self._schedule_midnight_check()
 
         # Vérification initiale
         QTimer.singleShot(500, self.update_reminders)
@@ -401,18 +570,18 @@ class MainWindow(QMainWindow):
     # --- Utilitaires colonnes
     def hide_columns(self, names: list[str]):
         for name in names:
-            col = self.model.fieldIndex(name)
+            col = self._proxy_col.get(name, -1)
             if col >= 0:
-                self.table.setColumnHidden(self.proxy.mapFromSource(self.model.index(0, col)).column(), True)
+                self.table.setColumnHidden(col, True)
                 
-    def _update_row(self, row: int, d: dict):
+    def _update_row(self, row: int, d: dict) -> bool:
         """Met à jour une ligne existante dans la base SQLite."""
         # Récupération de l'ID de la ligne
-        id_col = self.model.fieldIndex("id")
+        id_col = self._col["id"]
         id_val = self.model.data(self.model.index(row, id_col))
         if not id_val:
             QMessageBox.critical(self, APP_NAME, "Impossible de retrouver l'ID de la candidature.")
-            return
+            return False
 
         # Préparation de la requête SQL
         q = QSqlQuery()
@@ -438,6 +607,33 @@ class MainWindow(QMainWindow):
         # Exécution
         if not q.exec():
             QMessageBox.critical(self, APP_NAME, f"Erreur lors de la mise à jour : {q.lastError().text()}")
+            return False
+        return True
+
+    def _update_many(self, rows: list[dict], lines: list[int] | None = None) -> bool:
+        """Met à jour des lignes existantes (clé 'id') avec une seule requête préparée.
+
+        ``lines`` (n° de ligne CSV de chaque élément) sert seulement au message d'erreur.
+        """
+        if not rows:
+            return True
+        q = QSqlQuery()
+        q.prepare(
+            f"""UPDATE {TABLE_NAME} SET
+                numero=:numero, titre=:titre, structure=:structure,
+                date_limite=:date_limite, priorite=:priorite,
+                canal_envoi=:canal_envoi, statut=:statut,
+                date_envoi=:date_envoi, notes=:notes
+            WHERE id=:id"""
+        )
+        for i, d in enumerate(rows):
+            for k, v in d.items():
+                q.bindValue(f":{k}", v)
+            if not q.exec():
+                where = f" (ligne CSV {lines[i]})" if lines else ""
+                QMessageBox.critical(self, APP_NAME, f"Erreur lors de la mise à jour{where} : {q.lastError().text()}")
+                return False
+        return True
 
     # --- CRUD
     @Slot()
@@ -447,11 +643,12 @@ class MainWindow(QMainWindow):
             data = dlg.get_data()
             if data is None:
                 return
-            self._insert_row(data)
-            self.model.select()
-            self.status.showMessage("Candidature ajoutée", 2500)
+            if self._insert_row(data):
+                self.model.select()
+                self.update_reminders()
+                self.status.showMessage("Candidature ajoutée", 2500)
 
-    def _insert_row(self, d: dict):
+    def _insert_row(self, d: dict) -> bool:
         q = QSqlQuery()
         q.prepare(
             f"""
@@ -464,6 +661,31 @@ class MainWindow(QMainWindow):
             q.bindValue(f":{k}", v)
         if not q.exec():
             QMessageBox.critical(self, APP_NAME, f"Erreur d'insertion : {q.lastError().text()}")
+            return False
+        return True
+
+    def _insert_many(self, rows: list[dict], lines: list[int] | None = None) -> bool:
+        """Insère les lignes par paquets via un INSERT multi-VALUES (une préparation par paquet).
+
+        ``lines`` (n° de ligne CSV de chaque élément) sert seulement au message d'erreur.
+        """
+        cols = ", ".join(EDIT_FIELDS)
+        placeholders = "(" + ", ".join("?" * len(EDIT_FIELDS)) + ")"
+        for start in range(0, len(rows), INSERT_BATCH):
+            chunk = rows[start:start + INSERT_BATCH]
+            q = QSqlQuery()
+            q.prepare(
+                f"INSERT INTO {TABLE_NAME} ({cols}) VALUES "
+                + ", ".join([placeholders] * len(chunk))
+            )
+            for d in chunk:
+                for f in EDIT_FIELDS:
+                    q.addBindValue(d.get(f))
+            if not q.exec():
+                where = f" (lignes CSV {lines[start]} à {lines[start + len(chunk) - 1]})" if lines else ""
+                QMessageBox.critical(self, APP_NAME, f"Erreur d'insertion{where} : {q.lastError().text()}")
+                return False
+        return True
 
     @Slot()
     def edit_selected(self):
@@ -478,9 +700,13 @@ class MainWindow(QMainWindow):
             new_data = dlg.get_data()
             if new_data is None:
                 return
-            self._update_row(row, new_data)
-            self.model.select()
-            self.status.showMessage("Candidature modifiée", 2500)
+            # Rien à écrire ni à recharger si aucun champ n'a changé
+            if all(new_data[k] == data.get(k) for k in new_data):
+                return
+            if self._update_row(row, new_data):
+                self.model.select()
+                self.update_reminders()
+                self.status.showMessage("Candidature modifiée", 2500)
 
     @Slot()
     def delete_selected(self):
@@ -489,14 +715,16 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, APP_NAME, "Sélectionnez une ligne à supprimer.")
             return
         row = idx.row()
-        id_col = self.model.fieldIndex("id")
+        id_col = self._col["id"]
         id_val = self.model.data(self.model.index(row, id_col))
         if QMessageBox.question(self, APP_NAME, "Confirmer la suppression ?") == QMessageBox.Yes:
-            q = QSqlQuery()
-            if not q.exec(f"DELETE FROM {TABLE_NAME} WHERE id = {int(id_val)}"):
+            q = self._delete_stmt
+            q.bindValue(":id", int(id_val))
+            if not q.exec():
                 QMessageBox.critical(self, APP_NAME, f"Erreur de suppression : {q.lastError().text()}")
             else:
                 self.model.select()
+                self.update_reminders()
                 self.status.showMessage("Candidature supprimée", 2500)
 
     # --- Import / Export
@@ -505,49 +733,35 @@ class MainWindow(QMainWindow):
         path, _ = QFileDialog.getSaveFileName(self, "Exporter CSV", "candidatures.csv", "CSV (*.csv)")
         if not path:
             return
-        headers = [
-            "id","numero","titre","structure","date_limite","priorite",
-            "canal_envoi","statut","date_envoi","notes","created_at"
-        ]
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        # Lecture directe en SQL, ligne à ligne (sans passer par le modèle Qt)
+        q = QSqlQuery()
+        q.setForwardOnly(True)
+        if not q.exec(f"SELECT {', '.join(FIELDS)} FROM {TABLE_NAME} ORDER BY id"):
+            QMessageBox.critical(self, APP_NAME, f"Erreur d'export : {q.lastError().text()}")
+            return
+        n = len(FIELDS)
+
+        def rows():
+            while q.next():
+                yield [q.value(i) for i in range(n)]
+
+        # Tampon de 1 Mo : écriture en gros blocs plutôt qu'un write par ligne
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             writer = csv.writer(f)
-            writer.writerow(headers)
-            for r in range(self.model.rowCount()):
-                row = []
-                for h in headers:
-                    col = self.model.fieldIndex(h)
-                    row.append(self.model.data(self.model.index(r, col)))
-                writer.writerow(row)
+            writer.writerow(FIELDS)
+            writer.writerows(rows())
         self.status.showMessage(f"Exporté vers {path}", 4000)
     
     def toggle_theme(self):
         """Bascule entre le mode clair et sombre."""
         if not self.dark_mode:
             # Mode sombre
-            self.setStyleSheet("""
-                QMainWindow { background-color: #121212; color: #eee; }
-                QWidget { background-color: #121212; color: #eee; }
-                QLineEdit, QTextEdit, QComboBox, QDateEdit, QSpinBox {
-                    background-color: #1e1e1e; color: #eee; border: 1px solid #444;
-                }
-                QTableView {
-                    background-color: #1e1e1e;
-                    alternate-background-color: #2a2a2a;
-                    color: #eee;
-                    gridline-color: #444;
-                }
-                QHeaderView::section {
-                    background-color: #2a2a2a;
-                    color: #eee;
-                    padding: 4px;
-                    border: 1px solid #444;
-                }
-            """)
+            self.setStyleSheet(DARK_QSS)
             self.btn_theme.setText("Mode clair")
             self.dark_mode = True
         else:
             # Mode clair
-            self.setStyleSheet("")
+            self.setStyleSheet(LIGHT_QSS)
             self.btn_theme.setText("Mode sombre")
             self.dark_mode = False
 
@@ -558,47 +772,98 @@ class MainWindow(QMainWindow):
         if not path:
             return
         # Import tolérant : si 'id' existe et correspond, on met à jour; sinon on insère.
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                payload = {
-                    "numero": row.get("numero") or None,
-                    "titre": row.get("titre") or None,
-                    "structure": row.get("structure") or None,
-                    "date_limite": row.get("date_limite") or None,
-                    "priorite": row.get("priorite") or None,
-                    "canal_envoi": row.get("canal_envoi") or None,
-                    "statut": row.get("statut") or None,
-                    "date_envoi": row.get("date_envoi") or None,
-                    "notes": row.get("notes") or None,
-                }
-                rid = row.get("id")
-                if rid:
-                    # Update si l'enregistrement existe
-                    q = QSqlQuery()
-                    q.prepare(
-                        f"""UPDATE {TABLE_NAME} SET
-                            numero=:numero, titre=:titre, structure=:structure,
-                            date_limite=:date_limite, priorite=:priorite,
-                            canal_envoi=:canal_envoi, statut=:statut,
-                            date_envoi=:date_envoi, notes=:notes
-                        WHERE id=:id"""
-                    )
-                    for k, v in payload.items():
-                        q.bindValue(f":{k}", v)
-                    q.bindValue(":id", rid)
-                    if not q.exec():
-                        # si update échoue, on tente un insert
-                        self._insert_row(payload)
-                else:
-                    self._insert_row(payload)
-        self.model.select()
+        # Les lignes sans titre sont ignorées et signalées ; pour le reste, l'import se fait
+        # dans une seule transaction (un seul commit disque) : une erreur SQL annule tout l'import.
+        db = QSqlDatabase.database()
+        db.transaction()
+        # Ids déjà en base : décide à l'avance entre UPDATE et INSERT
+        existing_ids = set()
+        q = QSqlQuery()
+        q.setForwardOnly(True)
+        q.exec(f"SELECT id FROM {TABLE_NAME}")
+        while q.next():
+            existing_ids.add(q.value(0))
+        to_update: list[dict] = []
+        to_insert: list[dict] = []
+        update_lines: list[int] = []
+        insert_lines: list[int] = []
+        skipped: list[int] = []
+        written = 0
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    payload = {
+                        "numero": row.get("numero") or None,
+                        "titre": row.get("titre") or None,
+                        "structure": row.get("structure") or None,
+                        "date_limite": row.get("date_limite") or None,
+                        "priorite": row.get("priorite") or None,
+                        "canal_envoi": row.get("canal_envoi") or None,
+                        "statut": row.get("statut") or None,
+                        "date_envoi": row.get("date_envoi") or None,
+                        "notes": row.get("notes") or None,
+                    }
+                    if not payload["titre"]:
+                        # Titre obligatoire (NOT NULL) : ligne ignorée plutôt qu'échec du paquet
+                        skipped.append(reader.line_num)
+                        continue
+                    rid = row.get("id")
+                    rid = int(rid) if rid and rid.strip().isdigit() else None
+                    if rid in existing_ids:
+                        to_update.append({**payload, "id": rid})
+                        update_lines.append(reader.line_num)
+                    else:
+                        to_insert.append(payload)
+                        insert_lines.append(reader.line_num)
+                    if len(to_update) + len(to_insert) >= IMPORT_CHUNK:
+                        if not (self._update_many(to_update, update_lines)
+                                and self._insert_many(to_insert, insert_lines)):
+                            db.rollback()
+                            return
+                        written += len(to_update) + len(to_insert)
+                        for pending in (to_update, to_insert, update_lines, insert_lines):
+                            pending.clear()
+            # Reliquat du dernier paquet
+            if not (self._update_many(to_update, update_lines)
+                    and self._insert_many(to_insert, insert_lines)):
+                db.rollback()
+                return
+            written += len(to_update) + len(to_insert)
+        except Exception as e:
+            db.rollback()
+            QMessageBox.critical(self, APP_NAME, f"Erreur d'import : {e}")
+            return
+        if not db.commit():
+            db.rollback()
+            QMessageBox.critical(self, APP_NAME, f"Erreur d'import : {db.lastError().text()}")
+            return
+        if written:
+            self.model.select()
+            self.update_reminders()
+        if skipped:
+            shown = ", ".join(str(n) for n in skipped[:20]) + (" …" if len(skipped) > 20 else "")
+            QMessageBox.warning(
+                self, APP_NAME,
+                f"{len(skipped)} ligne(s) ignorée(s), titre manquant (lignes CSV {shown})."
+            )
         self.status.showMessage(f"Import depuis {path} terminé", 4000)
 
     # --- Rappels
     def on_remind_days_changed(self, days: int):
         self.remind_days = int(days)
+        self.remindThresholdDaysChanged.emit(self.remind_days)
+
+    def _schedule_midnight_check(self):
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+        # Petite marge pour être sûr d'être passé au jour suivant
+        ms = int((midnight - now).total_seconds() * 1000) + 1000
+        QTimer.singleShot(ms, self._on_midnight)
+
+    def _on_midnight(self):
         self.update_reminders()
+        self._schedule_midnight_check()
 
     def update_reminders(self):
         # Compte des candidatures dont la date limite est aujourd'hui ou dans N jours
@@ -609,17 +874,15 @@ class MainWindow(QMainWindow):
             self.lbl_alerts.setText("")
 
     def count_deadline_within(self, days: int) -> int:
-        q = QSqlQuery()
-        today = datetime.today().strftime(DATE_FMT)
-        limit = (datetime.today() + timedelta(days=days)).strftime(DATE_FMT)
-        q.prepare(
-            f"SELECT COUNT(*) FROM {TABLE_NAME} WHERE statut = 'À postuler' AND date_limite IS NOT NULL AND date_limite BETWEEN :d1 AND :d2"
-        )
-        q.bindValue(":d1", today)
-        q.bindValue(":d2", limit)
+        q = self._remind_stmt
+        today = date.today()
+        q.bindValue(":d1", today.isoformat())
+        q.bindValue(":d2", (today + timedelta(days=days)).isoformat())
         if not q.exec():
             return 0
-        return q.next() and q.value(0) or 0
+        n = q.next() and q.value(0) or 0
+        q.finish()
+        return n
 
     # --- Helpers
     def _current_source_index(self):
@@ -627,14 +890,9 @@ class MainWindow(QMainWindow):
         return self.proxy.mapToSource(idx)
 
     def _row_to_dict(self, row: int) -> dict:
-        fields = [
-            "id","numero","titre","structure","date_limite","priorite",
-            "canal_envoi","statut","date_envoi","notes","created_at"
-        ]
         out = {}
-        for f in fields:
-            col = self.model.fieldIndex(f)
-            out[f] = self.model.data(self.model.index(row, col))
+        for f in FIELDS:
+            out[f] = self.model.data(self.model.index(row, self._col[f]))
         return out
 
 